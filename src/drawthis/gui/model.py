@@ -1,3 +1,5 @@
+from typing import Optional
+
 from drawthis.app.config import SettingsManager
 from drawthis.app.constants import DATABASE_FILE
 from drawthis.app.signals import widget_deleted, timer_changed, folder_added
@@ -32,7 +34,7 @@ class Model:
 
     def __init__(self):
         self._settings_manager = SettingsManager()
-        self._database_manager = DatabaseManager(DATABASE_FILE)
+        self._database_manager: DatabaseManager | None = None
         self.session = Session()
         self.last_session = Session()
 
@@ -55,6 +57,8 @@ class Model:
         """
         if timer <= 0:
             raise ValueError(f"Invalid timer inserted: {timer}")
+        if timer in self.session.timers:
+            return
         self.session.timers.add(timer)
         timer_changed.send(self)
 
@@ -77,10 +81,21 @@ class Model:
         self.session.timers.remove(timer)
         widget_deleted.send(self, widget_type="timer", value=timer)
 
-    def save_session(self) -> None:
-        """Set session parameters in settings_manager and persists"""
-        self._settings_manager.write_config(self.session.copy())
-        self.last_session = self.session.copy()
+    def save_session(self, session: Optional[Session] = None) -> None:
+        """
+        Set session parameters in settings_manager and persists
+
+        Skips rewriting the config file when nothing changed since the
+        last saved session.
+
+        Args:
+            session: Session to persist, defaults to the current session.
+        """
+        session = session or self.session
+        if session.to_dict() == self.last_session.to_dict():
+            return
+        self._settings_manager.write_config(session.copy())
+        self.last_session = session.copy()
 
     # Acessors:
 
@@ -94,12 +109,31 @@ class Model:
         """Add a new timer if not already present."""
         self.session.is_running = value
 
-    def recalculate_if_should_recalculate(self) -> None:
+    @property
+    def database_manager(self) -> DatabaseManager:
+        """
+        Return the image database manager, opening it on first use.
+
+        Keeps the SQLite connection, pragmas and schema check off the
+        startup path, so the window shows before the database is touched.
+        """
+        if self._database_manager is None:
+            self._database_manager = DatabaseManager(DATABASE_FILE)
+        return self._database_manager
+
+    def recalculate_if_should_recalculate(
+        self, session: Optional[Session] = None
+    ) -> None:
         """
         Recalculates database if folders changed from last session.
         Deleted folders are disabled folders or removed folders.
+
+        Args:
+            session: Session to apply, defaults to the current session. Pass
+                a copy when calling off the Tk thread.
         """
-        current_folders = set(self.session.folders.enabled)
+        session = session or self.session
+        current_folders = set(session.folders.enabled)
         if not current_folders:
             return
         previous_folders = set(self.last_session.folders.enabled)
@@ -108,6 +142,6 @@ class Model:
         added_folders = current_folders - previous_folders
         deleted_folders = previous_folders - current_folders
         if deleted_folders:
-            self._database_manager.remove_rows(deleted_folders)
+            self.database_manager.remove_rows(deleted_folders)
         if added_folders:
-            self._database_manager.add_rows(added_folders)
+            self.database_manager.add_rows(added_folders)
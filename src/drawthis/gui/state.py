@@ -1,3 +1,4 @@
+from bisect import bisect_left
 from dataclasses import dataclass, field
 
 """
@@ -11,7 +12,7 @@ Dataclasses:
 """
 
 
-@dataclass
+@dataclass(slots=True)
 class FolderSet:
     """
     Wrapper for a set of folders
@@ -30,6 +31,10 @@ class FolderSet:
             fs.add(path, enabled)
         return fs
 
+    def __contains__(self, path: str) -> bool:
+        """Check membership without copying the folder dict."""
+        return path in self._folders
+
     def add(self, path: str, enabled: bool = True) -> None:
         """Add a folder with optional enabled state."""
         self._folders[path] = enabled
@@ -71,7 +76,7 @@ class FolderSet:
         return FolderSet(_folders=self.all)
 
 
-@dataclass
+@dataclass(slots=True)
 class TimerSet:
     """
     Wrapper for a set of timers
@@ -91,16 +96,24 @@ class TimerSet:
             ts.add(timer)
         return ts
 
+    def __contains__(self, timer: int) -> bool:
+        """Check membership by bisection on the sorted list."""
+        index = bisect_left(self._timers, timer)
+        return index < len(self._timers) and self._timers[index] == timer
+
     def add(self, timer: int) -> None:
-        """Add a new timer if not already present, then sort timer list"""
-        if timer in self._timers:
+        """Add a new timer if not already present, keeping the list sorted"""
+        index = bisect_left(self._timers, timer)
+        if index < len(self._timers) and self._timers[index] == timer:
             return
-        self._timers.append(timer)
-        self._timers = sorted(self._timers)
+        self._timers.insert(index, timer)
 
     def remove(self, timer: int) -> None:
-        """Remove a timer"""
-        self._timers.remove(timer)
+        """Remove a timer, raising ValueError if it is not present"""
+        index = bisect_left(self._timers, timer)
+        if index == len(self._timers) or self._timers[index] != timer:
+            raise ValueError(f"{timer} not in TimerSet")
+        del self._timers[index]
 
     @property
     def all(self) -> list[int]:
@@ -112,7 +125,7 @@ class TimerSet:
         return TimerSet(_timers=self.all)
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     timers: TimerSet = field(default_factory=TimerSet)
     folders: FolderSet = field(default_factory=FolderSet)
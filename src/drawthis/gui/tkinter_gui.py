@@ -1,5 +1,7 @@
 import tkinter as tk
-from typing import Optional, Any, Type
+from functools import partial
+from itertools import islice
+from typing import Optional, Any, Type, Iterator
 
 """
 Tkinter GUI for Draw-This.
@@ -17,6 +19,9 @@ This file is imported by Viewmodel as a package according to the following:
      from drawthis import View
 """
 
+# Folder rows built per event-loop pass while populating the folder list
+FOLDER_BUILD_CHUNK_SIZE = 50
+
 
 class View:
     """Build and maintains the GUI and sends state to interface module.
@@ -33,6 +38,10 @@ class View:
 
         self._folder_widgets: dict[str, dict[str, tk.Widget]] = {}
         self._timer_widgets: dict[int, dict[str, tk.Widget]] = {}
+        self._widget_dicts: dict[str, dict] = {
+            "folder": self._folder_widgets,
+            "timer": self._timer_widgets,
+        }
 
         self.root = tk.Tk()
         self.delay_var = tk.IntVar(value=self._viewmodel.last_timer)
@@ -53,11 +62,9 @@ class View:
         """
 
         var = enabled
-
-        def on_folder_change(*args) -> None:
-            self._viewmodel.sync_folder(folder)
-
-        var.trace_add(mode="write", callback=on_folder_change)
+        var.trace_add(
+            mode="write", callback=partial(self._on_folder_change, folder)
+        )
         self._build_widget(
             key=folder,
             parent_frame=self.folder_frame,
@@ -67,26 +74,26 @@ class View:
         )
 
     def refresh_timer_gui(self, timers: list[int]) -> None:
-        """Adds a single timer, with duration received via user interaction
-        to the internal attribute and to the GUI.
+        """Sync the timer rows with the given timers, building only rows for
+        new timers and destroying only rows for removed ones.
 
                 Args:
                     :param timers: List of timers in viewmodel.
         """
-        clear_gui_widgets(self._timer_widgets)
-
-        for timer in timers:
-            self._build_widget(
-                key=timer,
-                parent_frame=self.timer_frame,
-                main_widget_class=tk.Radiobutton,
-                main_widget_args={
-                    "text": f"{timer} seconds",
-                    "variable": self.delay_var,
-                    "value": timer,
-                },
-                widget_type="timer",
-            )
+        wanted = set(timers)
+        for timer in [t for t in self._timer_widgets if t not in wanted]:
+            self.delete_widget("timer", timer)
+
+        # Walk backwards so each new row can be packed before its successor
+        next_row = None
+        for timer in reversed(timers):
+            if timer not in self._timer_widgets:
+                self._build_timer_row(timer)
+                if next_row is not None:
+                    self._timer_widgets[timer]["row"].pack_configure(
+                        before=next_row
+                    )
+            next_row = self._timer_widgets[timer]["row"]
 
     def delete_widget(self, widget_type: str, widget_value: str | int) -> None:
         """Removes all components of a single widget from the GUI AND updates
@@ -96,11 +103,7 @@ class View:
                     :param widget_type: Widget dict from which to remove widget
                     :param widget_value: [UNIQUE] Value of widget to be removed
         """
-        widget_dicts = {
-            "folder": self._folder_widgets,
-            "timer": self._timer_widgets,
-        }
-        widget = widget_dicts[widget_type].pop(widget_value)
+        widget = self._widget_dicts[widget_type].pop(widget_value)
         for component in widget.values():
             component.destroy()
 
@@ -161,8 +164,22 @@ class View:
         )
         add_button.pack(side="right")
 
-        for folder, enabled in self._viewmodel.tk_folders:
+        self._build_folder_rows(iter(list(self._viewmodel.tk_folders.items())))
+
+    def _build_folder_rows(
+        self, folders: Iterator[tuple[str, tk.BooleanVar]]
+    ) -> None:
+        """
+        Build folder rows one chunk at a time.
+
+        Remaining rows are scheduled for when the event loop is idle, so
+        the window paints before a large folder list is fully built.
+        """
+        chunk = list(islice(folders, FOLDER_BUILD_CHUNK_SIZE))
+        for folder, enabled in chunk:
             self.add_folder_gui(folder, enabled)
+        if len(chunk) == FOLDER_BUILD_CHUNK_SIZE:
+            self.root.after_idle(self._build_folder_rows, folders)
 
     def _build_timer_section(self) -> None:
         """Assemble main window's horizontal timer list section."""
@@ -183,22 +200,12 @@ class View:
         add_button_timer = tk.Button(
             custom_timer_frame,
             text="Add",
-            command=lambda: self._viewmodel.add_timer(custom_entry),
+            command=partial(self._viewmodel.add_timer, custom_entry),
         )
         add_button_timer.pack(side="left")
 
         for timer in self._viewmodel.tk_timers:
-            self._build_widget(
-                key=timer,
-                parent_frame=self.timer_frame,
-                main_widget_class=tk.Radiobutton,
-                main_widget_args={
-                    "text": f"{timer} seconds",
-                    "variable": self.delay_var,
-                    "value": timer,
-                },
-                widget_type="timer",
-            )
+            self._build_timer_row(timer)
 
         timer_inf = tk.Radiobutton(
             self.timer_frame,
@@ -208,6 +215,20 @@ class View:
         )
         timer_inf.pack(side="right")
 
+    def _build_timer_row(self, timer: int) -> None:
+        """Build the radio button row for a single timer."""
+        self._build_widget(
+            key=timer,
+            parent_frame=self.timer_frame,
+            main_widget_class=tk.Radiobutton,
+            main_widget_args={
+                "text": f"{timer} seconds",
+                "variable": self.delay_var,
+                "value": timer,
+            },
+            widget_type="timer",
+        )
+
     def _build_buttons_section(self) -> None:
         """Assemble main window's "start" and "add folder" buttons."""
 
@@ -233,10 +254,7 @@ class View:
         if widget_type is None:
             widget_dict: dict[str, dict] = {}
         else:
-            widget_dict = {
-                "folder": self._folder_widgets,
-                "timer": self._timer_widgets,
-            }[widget_type]
+            widget_dict = self._widget_dicts[widget_type]
 
         row = tk.Frame(parent_frame)
         row.pack(fill="x", anchor="w", pady=1)
@@ -247,9 +265,7 @@ class View:
         del_btn = tk.Button(
             row,
             text="X",
-            command=lambda k=key: self._viewmodel.delete_widget(
-                widget_type, k
-            ),
+            command=partial(self._viewmodel.delete_widget, widget_type, key),
         )
         del_btn.pack(
             side="left" if main_widget_class == tk.Radiobutton else "right"
@@ -264,12 +280,6 @@ class View:
     def _on_timer_change(self, *args) -> None:
         self._viewmodel.sync_selected_timer()
 
+    def _on_folder_change(self, folder: str, *args) -> None:
+        self._viewmodel.sync_folder(folder)
 
-def clear_gui_widgets(widget_dict: dict) -> None:
-    """Removes all components of a single widget from the GUI ONLY."""
-
-    for widget in widget_dict.values():
-        for w in widget.values():
-            if hasattr(w, "destroy"):
-                w.destroy()
-    widget_dict.clear()
@@ -1,5 +1,6 @@
 import tkinter as tk
-from tkinter import filedialog
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
 
 from drawthis.app.constants import START_FOLDER
 from drawthis.app.signals import (
@@ -10,6 +11,7 @@ from drawthis.app.signals import (
     session_ended,
 )
 from drawthis.gui.model import Model
+from drawthis.gui.state import Session
 from drawthis.gui.tkinter_gui import View
 from drawthis.render import SlideshowManager
 from drawthis.utils.logger import logger
@@ -39,13 +41,25 @@ class Viewmodel:
         self.view = gui or View(self)
         self.signal_queue = SignalQueue()
         self.slideshow = SlideshowManager()
+        # One long-lived worker: the lazily opened database connection is
+        # bound to the thread that first uses it
+        self._database_worker = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="drawthis-database"
+        )
+        # Database update for a pending start, and the session it applies
+        self._pending_start: Future | None = None
+        self._pending_session: Session | None = None
 
         self.model.load_last_session()
-        self._tk_folders = [
-            (folder, tk.BooleanVar(value=enabled))
+        self._tk_folders = {
+            folder: tk.BooleanVar(value=enabled)
             for folder, enabled in self.model.session.folders.all.items()
-        ]
+        }
         self._tk_timers = self.model.session.timers.all
+        self._widget_deleters: dict[str, Callable[[Any], None]] = {
+            "folder": self._delete_folder,
+            "timer": self._delete_timer,
+        }
 
         self._subscribe_to_signals()
 
@@ -62,6 +76,8 @@ class Viewmodel:
                 msg=f"Execution failed due to error: {e}", exc_info=True
             )
             raise
+        finally:
+            self._database_worker.shutdown(wait=False, cancel_futures=True)
 
     def add_timer(self, new_timer: tk.Entry) -> None:
         """Add a new timer selected by the user if field not empty.
@@ -73,26 +89,24 @@ class Viewmodel:
         if timer == "":
             return
         try:
-            self.model.add_timer(int(new_timer.get()))
+            self.model.add_timer(int(timer))
         except ValueError:
             logger.warning(f"{timer} is an Invalid timer value")
 
     def add_folder(self) -> None:
         """Ask user for a folder and add folder if not already present."""
+        # Imported on first use; the dialog module is not needed at startup
+        from tkinter import filedialog
+
         folder_path = filedialog.askdirectory(initialdir=START_FOLDER)
-        if not folder_path or folder_path in self.model.session.folders.all:
+        if not folder_path or folder_path in self.model.session.folders:
             return
 
         self.model.add_folder(folder_path)
 
     def delete_widget(self, widget_type: str, value: str | int) -> None:
         """Remove widget of [value] from [widget_type] dict"""
-        if widget_type == "folder":
-            self.tk_folders = [p for p in self.tk_folders if p[0] != value]
-            self.model.delete_folder(value),
-        elif widget_type == "timer":
-            self.tk_timers.remove(value)
-            self.model.delete_timer(value),
+        self._widget_deleters[widget_type](value)
 
     def sync_folder(self, key: str) -> None:
         """Update folder selected status in model"""
@@ -111,26 +125,30 @@ class Viewmodel:
         - Persists current session parameters to the model.
         - Ensures one slideshow session at a time (no-op if already running).
 
-        Assumptions:
-        - The image database has already been populated.
+        The database update runs on a worker thread so the GUI stays
+        responsive while folders are crawled; the slideshow itself is
+        launched from the Tk thread once the update finishes. The worker
+        gets a snapshot of the session, and that same snapshot is saved and
+        shown, so edits made during the crawl are applied on the next start.
         """
-        if self.slideshow.is_running:
+        if self.slideshow.is_running or self._pending_start is not None:
             return
-        else:
-            self.model.recalculate_if_should_recalculate()
-            self.model.save_session()
-            self.slideshow.start(self.model.session.copy())
+        self._pending_session = self.model.session.copy()
+        self._pending_start = self._database_worker.submit(
+            self.model.recalculate_if_should_recalculate,
+            self._pending_session,
+        )
 
     # Accessors
 
     @property
-    def tk_folders(self) -> list[tuple[str, tk.BooleanVar]]:
-        """Return the list folders, with Tkinter vars."""
+    def tk_folders(self) -> dict[str, tk.BooleanVar]:
+        """Return the folders, keyed by path, with Tkinter vars."""
         return self._tk_folders
 
     @tk_folders.setter
-    def tk_folders(self, value: list[tuple[str, tk.BooleanVar]]) -> None:
-        """Set the list of folders, with Tkinter Vars."""
+    def tk_folders(self, value: dict[str, tk.BooleanVar]) -> None:
+        """Set the folders, keyed by path, with Tkinter Vars."""
         self._tk_folders = value
 
     @property
@@ -157,10 +175,33 @@ class Viewmodel:
         session_started.connect(self._on_session_started)
         session_ended.connect(self._on_session_ended)
 
+    def _delete_folder(self, path: str) -> None:
+        self.tk_folders.pop(path, None)
+        self.model.delete_folder(path)
+
+    def _delete_timer(self, timer: int) -> None:
+        self.tk_timers.remove(timer)
+        self.model.delete_timer(timer)
+
     def _poll_signals(self):
         self.signal_queue.poll_queue()
+        self._poll_pending_start()
         self.view.schedule(100, self._poll_signals)
 
+    def _poll_pending_start(self) -> None:
+        """Launch the slideshow once its database update has finished."""
+        if self._pending_start is None or not self._pending_start.done():
+            return
+        update, self._pending_start = self._pending_start, None
+        session, self._pending_session = self._pending_session, None
+        try:
+            update.result()
+        except Exception as e:
+            logger.error(f"Database update failed: {e}", exc_info=True)
+            return
+        self.model.save_session(session)
+        self.slideshow.start(session)
+
     def _on_widget_deleted(
         self, _, widget_type: str, value: str | int
     ) -> None:
@@ -174,7 +215,7 @@ class Viewmodel:
 
     def _on_folder_added(self, _, folder_path: str) -> None:
         var = tk.BooleanVar(value=True)
-        self.tk_folders.append((folder_path, var))
+        self.tk_folders[folder_path] = var
         self.view.add_folder_gui(folder=folder_path, enabled=var)
         logger.info("Folder added.")
 
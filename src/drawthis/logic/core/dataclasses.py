@@ -32,14 +32,14 @@ class ImageRow(NamedTuple):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class FileStat:
     st_mtime: float
     st_ino: int
     st_dev: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileEntry:
     path: str
     is_dir: bool
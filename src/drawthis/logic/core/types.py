@@ -1,9 +1,15 @@
 from abc import ABC, abstractmethod
+from pathlib import Path
 from typing import (
     Iterable,
     Any,
 )
 
+# Type aliases:
+
+PathLike = str | Path
+FolderInput = PathLike | Iterable[PathLike]
+
 
 class DatabaseBackend(ABC):
     """Abstract interface for database backends used in Draw-This."""
@@ -1,7 +1,11 @@
+import json
+import os
 import sqlite3
-from pathlib import Path
+import threading
+from itertools import chain, islice
 from typing import (
     Iterable,
+    Iterator,
     Callable,
     Optional,
     Any,
@@ -9,12 +13,18 @@ from typing import (
 
 from drawthis.logic.core.types import (
     DatabaseBackend,
+    PathLike,
 )
 
-# Type aliases:
+# Constants:
 
-PathLike = str | Path
-FolderInput = PathLike | Iterable[PathLike]
+STATEMENT_CACHE_SIZE = 256
+
+# Open connections and how many backends use each, keyed by (db_path,
+# thread id) since sqlite3 connections may only be used from the thread that
+# created them.
+_CONNECTION_CACHE: dict[tuple[str, int], tuple[sqlite3.Connection, int]] = {}
+_CONNECTION_CACHE_LOCK = threading.Lock()
 
 """
 This module defines all backends with which the DatabaseManager from Draw-This
@@ -56,21 +66,31 @@ class SQLite3Backend(DatabaseBackend):
     """
 
     DB_SCHEMA = """
-        id      INTEGER PRIMARY KEY AUTOINCREMENT,
+        id      INTEGER PRIMARY KEY,
         path    TEXT UNIQUE NOT NULL,
         randid  REAL,
         mtime   REAL,
         seen    BOOLEAN DEFAULT 0
     """
 
+    INSERT_QUERY = """
+        INSERT OR IGNORE INTO image_paths (path, randid, mtime)
+        VALUES {values}
+    """
+    INSERT_CHUNK_SIZE = 64
+    INSERT_ROW_ARITY = 3
+
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.database:
             try:
-                self.database.close()
+                self.flush()
             finally:
+                # A shared connection stays open for its other backends
+                if _release_connection(self.db_path, self.database):
+                    self.database.close()
                 self.database = None
 
     def __init__(
@@ -86,13 +106,19 @@ class SQLite3Backend(DatabaseBackend):
             raise ValueError(
                 "Must provide either db_path or an open sqlite3.Connection"
             )
-        self.database = connection or sqlite3.connect(self.db_path)
+        if connection is not None:
+            self.database, is_new_connection = connection, True
+        else:
+            self.database, is_new_connection = _get_connection(self.db_path)
         self.on_insert = on_insert
         self.on_remove = on_remove
         self.on_mark_seen = on_mark_seen
 
-        self.setup_schema()
-        self._configure_connection()
+        if is_new_connection:
+            # page_size only takes effect before the first write
+            self._configure_connection()
+        if not self._schema_exists():
+            self.setup_schema()
 
     def initialize(self) -> None:
         """Open the connection and ensure the schema exists."""
@@ -112,54 +138,43 @@ class SQLite3Backend(DatabaseBackend):
             self._execute(query)
 
     def insert_rows(self, rows: Iterable[tuple[Any, ...]]) -> int:
-        cursor = self.database.cursor()
-        cursor.executemany(
-            """
-            INSERT OR IGNORE INTO image_paths (path, randid, mtime)
-            VALUES (?, ?, ?)
-            """,
-            rows,
-        )
-        inserted = cursor.rowcount
-        cursor.close()
+        inserted = self._chunked_insert(rows)
         if self.on_insert:
             self.on_insert()
         return inserted
 
-    def remove_rows(self, paths: Iterable[str]) -> int:
+    def remove_rows(self, paths: Iterable[PathLike]) -> int:
         with self.database:
-            self.database.executemany(
+            cur = self._execute(
                 """
                 DELETE FROM image_paths
-                WHERE path = ?
+                WHERE path IN (SELECT value FROM json_each(?))
                 """,
-                [(p,) for p in paths],
+                self._as_json_array(paths),
             )
-            cur = self.database.execute("SELECT changes()")
-            removed = cur.fetchone()
         if self.on_remove:
             self.on_remove()
-        return removed[0] or 0
+        return cur.rowcount
 
-    def mark_seen(self, paths: Iterable[str], seen: bool = True) -> int:
+    def mark_seen(self, paths: Iterable[PathLike], seen: bool = True) -> int:
         """
         Set the `seen` flag for the supplied paths.
-        `paths` is an iterable of path strings.
+        `paths` is an iterable of path strings, bound as a single JSON
+        array and unnested by SQLite.
         """
         with self.database:
-            self.database.executemany(
+            cur = self._execute(
                 """
                 UPDATE image_paths
                 SET seen = ?
-                WHERE path = ?
+                WHERE path IN (SELECT value FROM json_each(?))
                 """,
-                [(int(seen), p) for p in paths],
+                int(seen),
+                self._as_json_array(paths),
             )
-            cur = self.database.execute("SELECT changes()")
-            marked = cur.fetchone()
         if self.on_mark_seen:
             self.on_mark_seen()
-        return marked[0] or 0
+        return cur.rowcount
 
     def shuffle(self) -> None:
         """
@@ -176,14 +191,17 @@ class SQLite3Backend(DatabaseBackend):
 
     def load_whole_database(self) -> list:
         """Return all entries from the database."""
+        return list(self.iter_whole_database())
+
+    def iter_whole_database(self) -> Iterator[str]:
+        """Yield all entries from the database, streamed off the cursor."""
         query = """
-        SELECT  path, randid, mtime
+        SELECT  path
         FROM image_paths
         ORDER BY randid
         """
-        cur = self.database.execute(query)
-        rows = cur.fetchall()
-        return [row[0] for row in rows]
+        for (path,) in self._execute(query):
+            yield path
 
     def count_rows(self) -> int:
         cur = self._execute("SELECT COUNT(*) FROM image_paths")
@@ -194,16 +212,154 @@ class SQLite3Backend(DatabaseBackend):
         try:
             if self.database:
                 self.database.commit()
-                self.database.execute("PRAGMA wal_checkpoint(FULL);")
         except sqlite3.DatabaseError as e:
             raise CommitError("Failed to commit to database") from e
 
+    def flush(self) -> None:
+        """
+        Checkpoint the WAL into the main database file and truncate it.
+
+        Commits leave checkpointing to SQLite's automatic checkpointer,
+        call this on shutdown to leave a compact database behind. Skipped
+        while a transaction is open, since SQLite cannot checkpoint then.
+        """
+        if self.database and not self.database.in_transaction:
+            self.database.execute("PRAGMA wal_checkpoint(TRUNCATE);")
+
     def _configure_connection(self):
-        self.database.execute("PRAGMA journal_mode = WAL;")
-        self.database.execute("PRAGMA synchronous = NORMAL;")
-        self.database.execute("PRAGMA temp_store = MEMORY;")
-        self.database.execute("PRAGMA foreign_keys = ON;")
+        self.database.executescript(
+            "PRAGMA page_size = 4096;"
+            "PRAGMA journal_mode = WAL;"
+            "PRAGMA synchronous = NORMAL;"
+            "PRAGMA wal_autocheckpoint = 1000;"
+            "PRAGMA temp_store = MEMORY;"
+            "PRAGMA foreign_keys = ON;"
+            "PRAGMA mmap_size = 268435456;"
+            "PRAGMA cache_size = -65536;"
+        )
+
+    def _schema_exists(self) -> bool:
+        """Return True if `image_paths` already exists."""
+        cur = self._execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            "image_paths",
+        )
+        return cur.fetchone() is not None
+
+    def _chunked_insert(
+        self,
+        rows: Iterable[tuple[Any, ...]],
+        chunk_size: Optional[int] = None,
+    ) -> int:
+        """
+        Insert rows with one multi-row VALUES statement per chunk.
+
+        Every full chunk reuses the same statement, only the trailing
+        partial chunk needs a second one of its own arity.
+
+        Args:
+            rows: Flat iterable of (path, randid, mtime) tuples.
+            chunk_size: Rows bound per statement.
+        Returns:
+            int: Number of rows inserted.
+        Raises:
+            sqlite3.ProgrammingError: A row does not have exactly three
+                values, which flattening would otherwise bind silently into
+                the neighbouring rows' columns.
+        """
+        chunk_size = chunk_size or self.INSERT_CHUNK_SIZE
+        full_chunk_query = self._insert_query(chunk_size)
+        inserted = 0
+        rows_iter = iter(rows)
+        # Rows may be lazy iterables, so each is materialised to be checked
+        while chunk := [tuple(row) for row in islice(rows_iter, chunk_size)]:
+            for row in chunk:
+                if len(row) != self.INSERT_ROW_ARITY:
+                    raise sqlite3.ProgrammingError(
+                        f"Expected {self.INSERT_ROW_ARITY} values per row,"
+                        f" got {len(row)}: {row!r}"
+                    )
+            if len(chunk) == chunk_size:
+                query = full_chunk_query
+            else:
+                query = self._insert_query(len(chunk))
+            cursor = self.database.execute(
+                query, list(chain.from_iterable(chunk))
+            )
+            inserted += cursor.rowcount
+        return inserted
+
+    def _insert_query(self, row_count: int) -> str:
+        """Return the INSERT statement binding `row_count` rows."""
+        return self.INSERT_QUERY.format(
+            values=", ".join(["(?, ?, ?)"] * row_count)
+        )
+
+    @staticmethod
+    def _as_json_array(paths: Iterable[PathLike]) -> str:
+        """
+        Serialise paths into a single JSON array parameter.
+
+        str paths go straight through the C encoder; os.fspath is only
+        called for the Path objects it cannot encode itself.
+        """
+        return json.dumps(list(paths), default=os.fspath)
 
     def _execute(self, query: str, *params: Any) -> sqlite3.Cursor:
         """Run a single statement with optional parameters."""
         return self.database.execute(query, params)
+
+
+# Connection cache helpers
+
+
+def _get_connection(db_path: PathLike) -> tuple[sqlite3.Connection, bool]:
+    """
+    Return a connection to db_path and whether it was newly opened.
+
+    File-backed connections are cached per path and thread, so repeated
+    backends skip reconnecting and keep their prepared statement cache.
+    Each call counts as one user until released by _release_connection.
+    In-memory databases are private to each connection and never cached.
+    """
+    if str(db_path) == ":memory:":
+        connection = sqlite3.connect(
+            db_path, cached_statements=STATEMENT_CACHE_SIZE
+        )
+        return connection, True
+
+    key = (str(db_path), threading.get_ident())
+    with _CONNECTION_CACHE_LOCK:
+        cached = _CONNECTION_CACHE.get(key)
+        if cached is not None:
+            connection, users = cached
+            _CONNECTION_CACHE[key] = (connection, users + 1)
+            return connection, False
+        connection = sqlite3.connect(
+            db_path, cached_statements=STATEMENT_CACHE_SIZE
+        )
+        _CONNECTION_CACHE[key] = (connection, 1)
+        return connection, True
+
+
+def _release_connection(
+    db_path: Optional[PathLike], connection: sqlite3.Connection
+) -> bool:
+    """
+    Release one user of a connection.
+
+    Returns:
+        bool: True once no backend uses the connection and it may be closed.
+            Connections that were never cached are always closable.
+    """
+    key = (str(db_path), threading.get_ident())
+    with _CONNECTION_CACHE_LOCK:
+        cached = _CONNECTION_CACHE.get(key)
+        if cached is None or cached[0] is not connection:
+            return True
+        users = cached[1] - 1
+        if users:
+            _CONNECTION_CACHE[key] = (connection, users)
+            return False
+        del _CONNECTION_CACHE[key]
+        return True
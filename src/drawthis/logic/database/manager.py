@@ -1,7 +1,8 @@
 import threading
-from pathlib import Path
+from operator import attrgetter
 from typing import (
     Iterable,
+    Iterator,
     Generator,
     Any,
 )
@@ -9,16 +10,11 @@ from typing import (
 from drawthis.logic.core.dataclasses import (
     ImageRow,
 )
+from drawthis.logic.core.types import PathLike
 from drawthis.logic.database.backends import SQLite3Backend
 from drawthis.logic.filesystem.crawler import Crawler
 from drawthis.utils.logger import logger
 
-# Type aliases:
-
-PathLike = str | Path
-FolderInput = PathLike | Iterable[PathLike]
-
-
 """
 SQLite file lister for Draw-This.
 
@@ -40,6 +36,9 @@ This file is imported as a package according to the following:
     import logic.file_listing
 """
 
+# Rows handed to the backend per insert call while crawling
+DEFAULT_BATCH_SIZE = 10000
+
 
 class DatabaseManager:
     """
@@ -68,7 +67,7 @@ class DatabaseManager:
     ):
         self.backend = backend or SQLite3Backend(db_path)
         self.crawler_class = crawler or Crawler
-        self.batch_size = batch_size or 1500
+        self.batch_size = batch_size or DEFAULT_BATCH_SIZE
 
         self.loading_block: list[str] = []
         self.file_count = 0
@@ -95,7 +94,9 @@ class DatabaseManager:
                 rows = self.generate_rows(folder, crawler)
                 batches = self.generator_of_batches(rows, self.batch_size)
                 for batch in batches:
-                    inserted += self.backend.insert_rows(batch)
+                    # Path-ordered inserts keep the unique index append-like
+                    ordered_batch = sorted(batch, key=attrgetter("file_path"))
+                    inserted += self.backend.insert_rows(ordered_batch)
                 logger.debug(
                     f"""
                     Crawl done: rom folder {folder} {inserted} were inserted.
@@ -165,3 +166,11 @@ class DatabaseManager:
         TODO remove once async loader has been implemented
         """
         return self.backend.load_whole_database()
+
+    def iter_all_rows(self) -> Iterator[str]:
+        """
+        Yield all database entries without materializing them in a list.
+
+        Prefer over load_all_rows when the caller consumes paths once.
+        """
+        return self.backend.iter_whole_database()
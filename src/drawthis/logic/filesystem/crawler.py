@@ -1,10 +1,10 @@
 import os
-import queue
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import (
     Iterable,
     Callable,
-    Generator,
     Optional,
 )
 
@@ -15,10 +15,13 @@ from drawthis.logic.core.protocols import (
     DirectoryScanner,
     FilterLike,
 )
+from drawthis.logic.core.types import PathLike, FolderInput
 from drawthis.utils.logger import logger
 
-PathLike = str | Path
-FolderInput = PathLike | Iterable[PathLike]
+# Directory scans run concurrently; scandir and stat release the GIL
+CRAWL_WORKERS = 8
+# Directory scans kept in flight ahead of the one being consumed
+CRAWL_PREFETCH = 32
 
 
 class Crawler:
@@ -49,7 +52,7 @@ class Crawler:
         self.on_start = on_start
         self.on_end = on_end
         self.on_skip = on_skip
-        self.directory_queue: queue.Queue[str] = queue.Queue()
+        self.directory_queue: deque[str] = deque()
         self.dir_access = dir_access_fn or os.scandir
         self.filter = bloom_filter
         self._files_skipped = 0
@@ -65,8 +68,7 @@ class Crawler:
 
     def clear_queue(self):
         """Clear directory queue"""
-        while not self.directory_queue.empty():
-            self.directory_queue.get()
+        self.directory_queue.clear()
 
     def reset_state(
         self,
@@ -88,22 +90,33 @@ class Crawler:
         if self.on_start:
             self.on_start()
 
-        while not self.directory_queue.empty():
-            current_directory = self.directory_queue.get()
-            try:
-                yield from self._generate_entries_from(current_directory)
-            except (
-                PermissionError,
-                FileNotFoundError,
-                NotADirectoryError,
-            ) as e:
-                self._files_skipped += 1
-                if self.on_skip:
-                    self.on_skip(current_directory, e)
-                else:
-                    logger.warning(
-                        f"Skipped {current_directory}", exc_info=True
-                    )
+        with ThreadPoolExecutor(max_workers=CRAWL_WORKERS) as pool:
+            # Scans are consumed in submission order, keeping the walk BFS
+            pending: deque[tuple[str, Future]] = deque()
+            while True:
+                while self.directory_queue and len(pending) < CRAWL_PREFETCH:
+                    directory = self.directory_queue.popleft()
+                    scan = pool.submit(self._scan_directory, directory)
+                    pending.append((directory, scan))
+                if not pending:
+                    break
+
+                current_directory, scan = pending.popleft()
+                try:
+                    files, subdirectories, failed = scan.result()
+                except (
+                    PermissionError,
+                    FileNotFoundError,
+                    NotADirectoryError,
+                ) as e:
+                    self._skip(current_directory, e)
+                    continue
+
+                for path, error in failed:
+                    self._skip(path, error)
+                # store absolute paths for bloom filter
+                self._enqueue(subdirectories)
+                yield from files
 
         if self.on_end:
             self.on_end()
@@ -116,44 +129,65 @@ class Crawler:
 
     # Private Helpers
 
-    def _generate_entries_from(
+    def _skip(self, path: str, error: OSError) -> None:
+        """Count and report a file or directory that could not be read."""
+        self._files_skipped += 1
+        if self.on_skip:
+            self.on_skip(path, error)
+        else:
+            logger.warning(f"Skipped {path}", exc_info=error)
+
+    def _scan_directory(
         self, directory: PathLike
-    ) -> Generator["FileEntry", None, None]:
+    ) -> tuple[list["FileEntry"], list[str], list[tuple[str, OSError]]]:
+        """
+        List one directory, returning its files, subdirectories and the
+        files that could not be stat'ed.
+
+        Runs on a worker thread, so it must not touch the queue, filter or
+        skip callbacks; failures are reported back to the crawling thread.
+        """
+        files: list[FileEntry] = []
+        subdirectories: list[str] = []
+        failed: list[tuple[str, OSError]] = []
         for entry in self.dir_access(str(directory)):
-            file_entry = FileEntry.from_dir_entry(entry)
-
-            if file_entry.is_symlink:
+            # DirEntry type checks are served from the directory listing;
+            # only files pay for the stat() that FileEntry needs
+            if entry.is_symlink():
                 # decide policy – here we skip them
                 continue
 
-            if file_entry.is_dir:
-                # store absolute path for bloom filter
-                self._enqueue(file_entry.path)
+            if entry.is_dir():
+                subdirectories.append(entry.path)
                 continue
 
-            yield file_entry
+            try:
+                files.append(FileEntry.from_dir_entry(entry))
+            except OSError as e:  # e.g. deleted between listing and stat
+                failed.append((entry.path, e))
+        return files, subdirectories, failed
 
     def _enqueue(self, folders: FolderInput):
         """Add folders to Crawler's queue"""
-        for directory in self._as_iterable(folders):
+        for directory in _as_iterable(folders):
             try:
-                absolute_path = self._normalise_path(directory)
+                absolute_path = _normalise_path(directory)
                 if absolute_path not in self.filter:
                     self.filter.add(absolute_path)
-                    self.directory_queue.put(absolute_path)
+                    self.directory_queue.append(absolute_path)
             except OSError:  # e.g. broken link
                 logger.warning("Relative to absolute path conversion failed")
 
-    @staticmethod
-    def _normalise_path(p: PathLike) -> str:
-        """Return absolute path from relative path"""
-        return os.path.abspath(str(p))
-
-    @staticmethod
-    def _as_iterable(item: FolderInput) -> Iterable[PathLike]:
-        """Convert to iterable"""
-        if isinstance(item, (str, Path)):
-            return [item]
-        if isinstance(item, Iterable):
-            return item
-        raise TypeError(f"Invalid type: {type(item)}")
+
+def _normalise_path(p: PathLike) -> str:
+    """Return absolute path from relative path"""
+    return os.path.abspath(str(p))
+
+
+def _as_iterable(item: FolderInput) -> Iterable[PathLike]:
+    """Convert to iterable"""
+    if isinstance(item, (str, Path)):
+        return [item]
+    if isinstance(item, Iterable):
+        return item
+    raise TypeError(f"Invalid type: {type(item)}")
@@ -1,5 +1,4 @@
 from .feh_backend import start_slideshow_feh
-from .opengl_backend import start_slideshow_ogl
 from .slideshow_manager import SlideshowManager
 
 __all__ = [
@@ -7,3 +6,13 @@ __all__ = [
     "start_slideshow_ogl",
     "SlideshowManager",
 ]
+
+
+def __getattr__(name: str):
+    # The OpenGL backend pulls in moderngl_window, numpy and PIL, so it is
+    # only imported once something actually asks for it.
+    if name == "start_slideshow_ogl":
+        from .opengl_backend import start_slideshow_ogl
+
+        return start_slideshow_ogl
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -36,9 +36,9 @@ def start_slideshow_feh(
                 :param selected_timer: Duration of each slide in seconds
     """
     # Populates a temp file with all paths to pass into the subprocess call
-    paths = DatabaseManager(DATABASE_FILE).load_all_rows()
+    paths = DatabaseManager(DATABASE_FILE).iter_all_rows()
     with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-        f.write("\n".join(paths))
+        f.writelines(f"{path}\n" for path in paths)
         filelist_path = f.name
 
     cmd = ["feh", "-rZ.", "-B", "black"]
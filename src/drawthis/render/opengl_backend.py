@@ -63,9 +63,8 @@ class RenderWindow(mglw.WindowConfig):
         Place images in a deque, for two-way navigation and display first
         image.
         """
-        self.images = deque(
-            [Path(p) for p in DatabaseManager(DATABASE_FILE).load_all_rows()]
-        )
+        # Plain strings; load_image builds the Path only for the shown image
+        self.images = deque(DatabaseManager(DATABASE_FILE).iter_all_rows())
         self._set_texture(self.images[0])
 
     # Event handlers
@@ -206,7 +205,7 @@ class RenderWindow(mglw.WindowConfig):
 def load_image(path: str | Path) -> tuple[np.ndarray, tuple[int, int]]:
     p = Path(path)
     try:
-        suffix = path.suffix.lower()
+        suffix = p.suffix.lower()
         if suffix in {".jp2", ".j2k", ".jpx"}:
             image = load_raw_image_pyav(p)
         else:
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 
 from drawthis.gui.state import Session
-from drawthis.render import start_slideshow_ogl, start_slideshow_feh
+from drawthis.render.feh_backend import start_slideshow_feh
 
 
 class SlideshowBackend(ABC):
@@ -17,6 +17,9 @@ class FehBackend(SlideshowBackend):
 
 class OGLBackend(SlideshowBackend):
     def start(self, session: Session = None):
+        # Deferred: the OpenGL stack is only loaded when this backend runs
+        from drawthis.render.opengl_backend import start_slideshow_ogl
+
         start_slideshow_ogl(**session.to_dict())
 
 
@@ -4,7 +4,7 @@ from pathlib import Path
 from PIL import Image
 from moderngl_window.context.base import KeyModifiers
 
-from drawthis.render.opengl_backend import RenderWindow
+from drawthis.render.opengl_backend import RenderWindow, load_image
 
 
 def make_dummy_image(color, size=(64, 64)):
@@ -43,6 +43,17 @@ def test_texture_loading(monkeypatch):
     # but good for local smoke testing
 
 
+def test_load_image_accepts_str_path(tmp_path):
+    """Database rows are plain str paths; load_image must accept them."""
+    image_path = tmp_path / "red.png"
+    make_dummy_image((255, 0, 0, 255), size=(4, 3)).save(image_path)
+
+    image, size = load_image(str(image_path))
+
+    assert size == (4, 3)
+    assert image.shape == (3, 4, 4)
+
+
 class TestWindow2(RenderWindow):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -1,7 +1,12 @@
+import os
+import sqlite3
+import tempfile
+import threading
 import tkinter as tk
 import unittest
 from unittest import mock
 
+from drawthis.gui.model import Model
 from drawthis.gui.state import Session
 from drawthis.gui.viewmodel import Viewmodel
 
@@ -20,7 +25,7 @@ class ViewmodelModelIntegrationn(unittest.TestCase):
 
     Steps:
     - Create a mock GUI and instantiate the ViewModel with it.
-    - Patch ``drawthis.gui.viewmodel.filedialog.askdirectory`` to return a
+    - Patch ``tkinter.filedialog.askdirectory`` to return a
       deterministic path and call ``add_folder()``.
     - Add a timer using a mocked Tkinter widget.
 
@@ -38,7 +43,7 @@ class ViewmodelModelIntegrationn(unittest.TestCase):
         file_paths = [f"fake/path/string/{i}" for i in range(3)]
 
         with mock.patch(
-            "drawthis.gui.viewmodel.filedialog.askdirectory",
+            "tkinter.filedialog.askdirectory",
             side_effect=file_paths,
         ):
             vm.add_folder()
@@ -98,7 +103,7 @@ class ViewmodelModelIntegrationn(unittest.TestCase):
 
         file_paths = [f"fake/path/string/{i}" for i in range(3)]
         with mock.patch(
-            "drawthis.gui.viewmodel.filedialog.askdirectory",
+            "tkinter.filedialog.askdirectory",
             side_effect=file_paths,
         ):
             vm.add_folder()
@@ -116,5 +121,141 @@ class ViewmodelModelIntegrationn(unittest.TestCase):
         session_bench = Session.from_dict(session_dict)
         with mock.patch.object(vm.slideshow, "start") as mock_start_slideshow:
             vm.start_slideshow()
+            vm._pending_start.result(timeout=5)
+            vm._poll_pending_start()
 
         mock_start_slideshow.assert_called_once_with(session_bench)
+
+
+class TestSlideshowStart(unittest.TestCase):
+    """
+    Verify that starting a slideshow updates the database off the Tk thread
+    and launches the slideshow from the session it was started with.
+    """
+
+    def setUp(self):
+        model = mock.Mock(spec=Model)
+        model.session = Session()
+        self.vm = Viewmodel(gui=MockView(), state=model)
+        self.vm.slideshow = mock.Mock(is_running=False)
+        self.recalculate = model.recalculate_if_should_recalculate
+
+    def _finish_pending_start(self):
+        self.vm._pending_start.exception(timeout=5)
+        self.vm._poll_pending_start()
+
+    def test_start_uses_session_snapshot(self):
+        self.vm.model.session.folders.add("/a")
+        crawl_started = threading.Event()
+        release_crawl = threading.Event()
+
+        def slow_recalculate(session):
+            crawl_started.set()
+            release_crawl.wait(timeout=5)
+
+        self.recalculate.side_effect = slow_recalculate
+        self.vm.start_slideshow()
+        self.assertTrue(crawl_started.wait(timeout=5))
+
+        # edits made during the crawl must not leak into this start
+        self.vm.model.session.folders.add("/b")
+        self.vm._poll_pending_start()
+        self.vm.slideshow.start.assert_not_called()
+
+        release_crawl.set()
+        self._finish_pending_start()
+
+        (applied,), _ = self.recalculate.call_args
+        self.assertIsNot(self.vm.model.session, applied)
+        self.assertEqual({"/a": True}, applied.folders.all)
+        self.vm.model.save_session.assert_called_once_with(applied)
+        self.vm.slideshow.start.assert_called_once_with(applied)
+
+    def test_second_start_ignored_while_pending(self):
+        release_crawl = threading.Event()
+        self.recalculate.side_effect = lambda session: release_crawl.wait(5)
+
+        self.vm.start_slideshow()
+        self.vm.start_slideshow()
+        release_crawl.set()
+        self._finish_pending_start()
+
+        self.recalculate.assert_called_once()
+        self.vm.slideshow.start.assert_called_once()
+
+    def test_failed_update_does_not_start(self):
+        from drawthis.utils.logger import logger
+
+        self.recalculate.side_effect = OSError("disk full")
+        self.vm.start_slideshow()
+        with self.assertLogs(logger, level="ERROR"):
+            self._finish_pending_start()
+
+        self.vm.model.save_session.assert_not_called()
+        self.vm.slideshow.start.assert_not_called()
+        # a later start is allowed again
+        self.recalculate.side_effect = None
+        self.vm.start_slideshow()
+        self._finish_pending_start()
+        self.vm.slideshow.start.assert_called_once()
+
+
+class TestSlideshowStartDatabase(unittest.TestCase):
+    """
+    Verify that repeated starts update a real file database, which binds its
+    connection to the thread that first opened it.
+    """
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.root = self._tmp_dir.name
+        self.db_path = os.path.join(self.root, "images.db")
+        patches = [
+            mock.patch("drawthis.gui.model.DATABASE_FILE", self.db_path),
+            mock.patch("drawthis.gui.model.SettingsManager"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        model = Model()
+        model._settings_manager.read_config.return_value = Session()
+        self.vm = Viewmodel(gui=MockView(), state=model)
+        self.vm.slideshow = mock.Mock(is_running=False)
+
+    def tearDown(self):
+        # The connection may only be closed from the thread that opened it
+        backend = self.vm.model.database_manager.backend
+        self.vm._database_worker.submit(
+            backend.__exit__, None, None, None
+        ).result(timeout=5)
+        self.vm._database_worker.shutdown()
+        self._tmp_dir.cleanup()
+
+    def _make_folder(self, name: str, file_count: int) -> str:
+        folder = os.path.join(self.root, name)
+        os.makedirs(folder)
+        for i in range(file_count):
+            open(os.path.join(folder, f"{i}.png"), "w").close()
+        return folder
+
+    def _start(self) -> None:
+        self.vm.start_slideshow()
+        self.vm._pending_start.exception(timeout=5)
+        self.vm._poll_pending_start()
+
+    def _row_count(self) -> int:
+        with sqlite3.connect(self.db_path) as connection:
+            return connection.execute(
+                "SELECT COUNT(*) FROM image_paths"
+            ).fetchone()[0]
+
+    def test_second_start_with_changed_folders(self):
+        self.vm.model.session.folders.add(self._make_folder("a", 2))
+        self._start()
+        self.assertEqual(2, self._row_count())
+
+        self.vm.model.session.folders.add(self._make_folder("b", 3))
+        self._start()
+
+        self.assertEqual(5, self._row_count())
+        self.assertEqual(2, self.vm.slideshow.start.call_count)
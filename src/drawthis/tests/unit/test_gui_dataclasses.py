@@ -16,6 +16,13 @@ class TestTimerSet(unittest.TestCase):
         # assert duplicate not added
         self.assertEqual([10, 30], ts.all)
 
+    def test_contains(self):
+        ts = TimerSet.from_list([5, 10])
+        self.assertIn(5, ts)
+        self.assertIn(10, ts)
+        self.assertNotIn(7, ts)
+        self.assertNotIn(99, ts)
+
     def test_remove(self):
         ts = TimerSet.from_list([5, 10])
         ts.remove(5)
@@ -57,6 +64,12 @@ class TestFolderSet(unittest.TestCase):
         fs.disable("x")
         self.assertIn("x", fs.disabled)
 
+    def test_contains(self):
+        fs = FolderSet.from_pairs([("a", True), ("b", False)])
+        self.assertIn("a", fs)
+        self.assertIn("b", fs)
+        self.assertNotIn("c", fs)
+
     def test_all_returns_copy(self):
         fs = FolderSet.from_pairs([("a", True)])
         d = fs.all
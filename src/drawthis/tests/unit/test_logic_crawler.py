@@ -0,0 +1,127 @@
+import os
+import tempfile
+import unittest
+
+from drawthis.logic.filesystem.crawler import Crawler
+
+"""
+Behavioral contract for Crawler:
+
+Core behaviors:
+  - Yields a FileEntry for every regular file under the given folders
+  - Walks directories breadth-first, even though scans run concurrently
+  - Skips symlinks, so linked directories can never loop the walk
+
+Error handling:
+  - Unreadable directories and files that vanish before stat are skipped,
+    counted and reported, without losing their siblings
+"""
+
+
+class FailingStatEntry:
+    """DirEntry wrapper whose stat() fails as if the file was deleted."""
+
+    def __init__(self, entry: os.DirEntry):
+        self._entry = entry
+        self.path = entry.path
+
+    def stat(self):
+        raise FileNotFoundError(self.path)
+
+    def is_dir(self) -> bool:
+        return self._entry.is_dir()
+
+    def is_symlink(self) -> bool:
+        return self._entry.is_symlink()
+
+
+class TestCrawlBehavior(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.root = os.path.realpath(self._tmp_dir.name)
+        self.skipped: list[tuple[str, Exception]] = []
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def _make_files(self, *relative_paths: str) -> None:
+        for relative_path in relative_paths:
+            path = os.path.join(self.root, relative_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            open(path, "w").close()
+
+    def _crawl(self, dir_access_fn=None) -> list[str]:
+        crawler = Crawler(
+            on_skip=lambda path, e: self.skipped.append((path, e)),
+            dir_access_fn=dir_access_fn,
+        )
+        with crawler:
+            paths = [entry.path for entry in crawler.crawl(self.root)]
+            self.files_skipped = crawler.files_skipped
+        return [os.path.relpath(path, self.root) for path in paths]
+
+    def test_yields_every_file_breadth_first(self):
+        self._make_files(
+            "top.png",
+            "a/a.png",
+            "a/deep/deep.png",
+            "a/deep/deeper/deeper.png",
+            "b/b.png",
+        )
+
+        paths = self._crawl()
+
+        self.assertCountEqual(
+            [
+                "top.png",
+                "a/a.png",
+                "b/b.png",
+                "a/deep/deep.png",
+                "a/deep/deeper/deeper.png",
+            ],
+            paths,
+        )
+        depths = [path.count(os.sep) for path in paths]
+        self.assertEqual(sorted(depths), depths)
+
+    def test_symlinks_are_skipped(self):
+        self._make_files("a/a.png")
+        os.symlink(
+            os.path.join(self.root, "a", "a.png"),
+            os.path.join(self.root, "link.png"),
+        )
+        # a directory link back to the root would loop without the guard
+        os.symlink(self.root, os.path.join(self.root, "a", "loop"))
+
+        self.assertEqual(["a/a.png"], self._crawl())
+        self.assertEqual([], self.skipped)
+
+    def test_vanished_file_skipped_without_losing_siblings(self):
+        self._make_files("keep.png", "gone.png", "sub/nested.png")
+        gone = os.path.join(self.root, "gone.png")
+
+        def scandir_with_vanished_file(directory):
+            for entry in os.scandir(directory):
+                yield FailingStatEntry(entry) if entry.path == gone else entry
+
+        paths = self._crawl(dir_access_fn=scandir_with_vanished_file)
+
+        self.assertCountEqual(["keep.png", "sub/nested.png"], paths)
+        self.assertEqual(1, self.files_skipped)
+        self.assertEqual(gone, self.skipped[0][0])
+        self.assertIsInstance(self.skipped[0][1], FileNotFoundError)
+
+    def test_unreadable_directory_skipped(self):
+        self._make_files("top.png", "locked/hidden.png", "open/seen.png")
+        locked = os.path.join(self.root, "locked")
+
+        def scandir_with_locked_dir(directory):
+            if directory == locked:
+                raise PermissionError(directory)
+            return os.scandir(directory)
+
+        paths = self._crawl(dir_access_fn=scandir_with_locked_dir)
+
+        self.assertCountEqual(["top.png", "open/seen.png"], paths)
+        self.assertEqual(1, self.files_skipped)
+        self.assertEqual(locked, self.skipped[0][0])
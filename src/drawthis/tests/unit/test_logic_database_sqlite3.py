@@ -1,4 +1,7 @@
+import os
+import tempfile
 import unittest
+from pathlib import Path
 from sqlite3 import ProgrammingError
 
 from drawthis.logic.core.dataclasses import ImageRow
@@ -25,22 +28,31 @@ Error handling:
 """
 
 
+_PARENTS = ("ching", "bing", "deng_xiao_ping")
+_ROWS_PER_PARENT = 5
+# _PATHS[parent][i] is the i-th fixture file under parent
+_PATHS = {
+    parent: tuple(f"{parent}/{i}.png" for i in range(_ROWS_PER_PARENT))
+    for parent in _PARENTS
+}
+
+
 def nested_list():
     batch = [
         [
-            ImageRow(file_path=f"{parent}/{i}.png", randid=i, mtime=i)
-            for i in range(5)
+            ImageRow(file_path=_PATHS[parent][i], randid=i, mtime=i)
+            for i in range(_ROWS_PER_PARENT)
         ]
-        for parent in {"ching", "bing", "deng_xiao_ping"}
+        for parent in _PARENTS
     ]
     return batch
 
 
 def flat_list():
     batch = [
-        ImageRow(file_path=f"{parent}/{i}.png", randid=i, mtime=i)
-        for i in range(5)
-        for parent in ["ching", "bing", "deng_xiao_ping"]
+        ImageRow(file_path=_PATHS[parent][i], randid=i, mtime=i)
+        for i in range(_ROWS_PER_PARENT)
+        for parent in _PARENTS
     ]
     return batch
 
@@ -68,11 +80,28 @@ class TestInsertBehavior(unittest.TestCase):
     AC3 Insertion commits atomically (WAL checkpoint visible)
     """
 
+    @classmethod
+    def setUpClass(cls):
+        # Rows are immutable, so every subTest can share one build
+        cls._FLAT_ROWS = flat_list()
+        cls._NESTED_ROWS = nested_list()
+
+    def setUp(self):
+        self.backend = SQLite3Backend(db_path=":memory:")
+
+    def tearDown(self):
+        self.backend.database.close()
+
+    def _reset_backend(self):
+        """Empty the shared backend between subTests."""
+        self.backend.clear_all()
+        self.backend.setup_schema()
+
     def test_input_all_flat_iterable_types(self):
         cases = [
             ("list", lambda flat: flat, 1, 15),
             ("tuple", tuple, 1, 15),
-            ("set", set, 1, 15),
+            ("frozenset", frozenset, 1, 15),
             ("iterator", iter, 1, 15),
             ("generator", lambda flat: (row for row in flat), 1, 15),
         ]
@@ -83,17 +112,14 @@ class TestInsertBehavior(unittest.TestCase):
                 exp_rows=exp_rows,
                 exp_commits=exp_commits,
             ):
-                # select fixture
-                fixture = nested_list if "nested" in iter_t else flat_list
-
-                # convert to desired iterable
-                batch_to_test = conv(fixture())
+                # adapt the shared flat rows to the desired iterable
+                batch_to_test = conv(self._FLAT_ROWS)
 
-                # create backend and insert
-                backend = SQLite3Backend(db_path=":memory:")
+                # reset shared backend and insert
+                self._reset_backend()
                 print(f"Testing: {iter_t}")
 
-                rows = backend.insert_rows(batch_to_test)
+                rows = self.backend.insert_rows(batch_to_test)
                 self.assertEqual(exp_rows, rows)
 
     def test_input_all_nested_iterable_types(self):
@@ -114,29 +140,68 @@ class TestInsertBehavior(unittest.TestCase):
         for iter_type, converter, exp_rows in cases:
             with self.subTest(iter_type=iter_type):
                 # select fixture
-                fixture_func = (
-                    nested_list if "nested" in iter_type else flat_list
+                fixture = (
+                    self._NESTED_ROWS
+                    if "nested" in iter_type
+                    else self._FLAT_ROWS
                 )
-                nested_iterable = converter(fixture_func())
+                nested_iterable = converter(fixture)
 
-                # create backend
-                backend = SQLite3Backend(db_path=":memory:")
+                # reset shared backend
+                self._reset_backend()
                 print(f"Testing: {iter_type}")
 
                 # directly inserting nested objects should raise
                 with self.assertRaises(ProgrammingError):
-                    backend.insert_rows(nested_iterable)
+                    self.backend.insert_rows(nested_iterable)
 
                 # regenerate iterable for actual insertion
-                fresh_iterable = converter(fixture_func())
+                fresh_iterable = converter(fixture)
 
                 # insert each nested object individually
                 rows_inserted = 0
                 for row_group in fresh_iterable:
-                    rows_inserted += backend.insert_rows(row_group)
+                    rows_inserted += self.backend.insert_rows(row_group)
 
                 self.assertEqual(exp_rows, rows_inserted)
 
+    def test_insert_across_chunk_boundaries(self):
+        """AC1/AC2 counts hold for full chunks, tails and duplicates"""
+        chunk = SQLite3Backend.INSERT_CHUNK_SIZE
+
+        def rows(indices):
+            return [
+                ImageRow(file_path=f"bulk/{i}.png", randid=i, mtime=i)
+                for i in indices
+            ]
+
+        cases = [
+            ("full_chunks", rows(range(2 * chunk)), 2 * chunk),
+            ("full_chunk_and_tail", rows(range(chunk + 7)), chunk + 7),
+            (
+                # repeats inside a chunk and across the chunk boundary
+                "duplicates",
+                rows(range(chunk + 7)) + rows(range(0, chunk + 7, 2)),
+                chunk + 7,
+            ),
+        ]
+        for name, batch, exp_rows in cases:
+            with self.subTest(case=name, rows=len(batch)):
+                self._reset_backend()
+
+                self.assertEqual(exp_rows, self.backend.insert_rows(batch))
+                self.assertEqual(exp_rows, self.backend.count_rows())
+                # re-inserting the same rows is ignored entirely
+                self.assertEqual(0, self.backend.insert_rows(iter(batch)))
+                self.assertEqual(exp_rows, self.backend.count_rows())
+
+        with self.subTest(case="malformed_rows"):
+            self._reset_backend()
+            # lengths add up to two rows, but neither row has three values
+            with self.assertRaises(ProgrammingError):
+                self.backend.insert_rows([("a", 1.0, 2.0, "x"), ("b", 3.0)])
+            self.assertEqual(0, self.backend.count_rows())
+
     def test_same_path_and_size(self):
         self.skipTest("Spec not implemented yet")
 
@@ -153,6 +218,45 @@ class TestInsertBehavior(unittest.TestCase):
         self.skipTest("Spec not implemented yet")
 
 
+class TestConnectionSharing(unittest.TestCase):
+    """
+    Behavioral contract: backends on the same file share one connection...
+
+    Expected behavior:
+    EB1 Closing one backend leaves the others usable
+    EB2 The connection is closed once its last backend is closed
+    """
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self._tmp_dir.name, "images.db")
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def test_closing_one_backend_keeps_others_open(self):
+        """EB1 Closing one backend leaves the others usable"""
+        with SQLite3Backend(db_path=self.db_path) as kept:
+            with SQLite3Backend(db_path=self.db_path) as closed:
+                self.assertIs(kept.database, closed.database)
+
+            self.assertEqual(1, kept.insert_rows(flat_list()[:1]))
+            self.assertEqual(1, kept.count_rows())
+
+    def test_last_backend_closes_connection(self):
+        """EB2 The connection is closed once its last backend is closed"""
+        with SQLite3Backend(db_path=self.db_path) as first:
+            connection = first.database
+            with SQLite3Backend(db_path=self.db_path):
+                pass
+            connection.execute("SELECT 1")
+
+        with self.assertRaises(ProgrammingError):
+            connection.execute("SELECT 1")
+        with SQLite3Backend(db_path=self.db_path) as reopened:
+            self.assertIsNot(connection, reopened.database)
+
+
 class TestRemoveBehavior(unittest.TestCase):
     """
     Behavioral contract: removal ops must always...
@@ -174,6 +278,29 @@ class TestRemoveBehavior(unittest.TestCase):
     AC4 Each removal query (by provided criteria) is atomic
     """
 
+    def setUp(self):
+        self.backend = SQLite3Backend(db_path=":memory:")
+        self.backend.insert_rows(flat_list())
+
+    def tearDown(self):
+        self.backend.database.close()
+
+    def test_removed_count_is_every_affected_row(self):
+        """AC1 Every listed path is removed and counted once"""
+        cases = [
+            ("multiple_paths", ["ching/0.png", "bing/1.png"], 2),
+            ("missing_path", ["nope/0.png"], 0),
+            ("mixed_paths", ["ching/3.png", "nope/0.png"], 1),
+            ("path_object", [Path("deng_xiao_ping/4.png")], 1),
+            ("empty", [], 0),
+        ]
+        remaining = len(flat_list())
+        for name, paths, exp_removed in cases:
+            with self.subTest(case=name):
+                self.assertEqual(exp_removed, self.backend.remove_rows(paths))
+                remaining -= exp_removed
+                self.assertEqual(remaining, self.backend.count_rows())
+
     def test_matching_entries_removed(self):
         """EB1 Remove every entry that matches"""
         self.skipTest("Spec not implemented yet")
@@ -195,6 +322,52 @@ class TestRemoveBehavior(unittest.TestCase):
         self.skipTest("Spec not implemented yet")
 
 
+class TestMarkSeenBehavior(unittest.TestCase):
+    """
+    Behavioral contract: mark_seen must always...
+
+    Acceptance criteria:
+    AC1 Sets the seen flag on exactly the listed, existing paths
+    AC2 Returns the number of rows updated
+    """
+
+    def setUp(self):
+        self.backend = SQLite3Backend(db_path=":memory:")
+        self.backend.insert_rows(flat_list())
+
+    def tearDown(self):
+        self.backend.database.close()
+
+    def _seen_paths(self) -> set[str]:
+        cur = self.backend.database.execute(
+            "SELECT path FROM image_paths WHERE seen = 1"
+        )
+        return {path for (path,) in cur}
+
+    def test_seen_count_and_flags(self):
+        """AC1/AC2 Listed paths are flagged and counted"""
+        marked = self.backend.mark_seen(
+            ["ching/0.png", Path("bing/1.png"), "nope/0.png"]
+        )
+
+        self.assertEqual(2, marked)
+        self.assertEqual({"ching/0.png", "bing/1.png"}, self._seen_paths())
+
+    def test_unmark_seen(self):
+        """AC1 seen=False clears the flag again"""
+        self.backend.mark_seen(["ching/0.png", "bing/1.png"])
+
+        self.assertEqual(
+            1, self.backend.mark_seen(["ching/0.png"], seen=False)
+        )
+        self.assertEqual({"bing/1.png"}, self._seen_paths())
+
+    def test_missing_paths_update_nothing(self):
+        """AC2 Paths absent from the database are not counted"""
+        self.assertEqual(0, self.backend.mark_seen(["nope/0.png"]))
+        self.assertEqual(set(), self._seen_paths())
+
+
 class TestLoadBehavior(unittest.TestCase):
     """
     Behavioral contract: Load operations must always...
@@ -1,7 +1,9 @@
+import os
 import random
 import sys
 import unittest
-from typing import Callable, NamedTuple
+from dataclasses import dataclass
+from typing import Callable
 from unittest import mock
 
 from drawthis.logic.core.dataclasses import FileEntry, ImageRow
@@ -12,17 +14,12 @@ _is_dir: bool
 _is_symlink: bool
 
 
+@dataclass(slots=True)
 class MockDirEntry:
-    path: str
     _stat_result: "StatLike"
     _is_dir: bool
     _is_symlink: bool
-
-    def __init__(self, stat_result, is_dir, is_symlink, path):
-        self.path = path
-        self._is_dir = is_dir
-        self._is_symlink = is_symlink
-        self._stat_result = stat_result
+    path: str
 
     def stat(self) -> "StatLike":
         return self._stat_result
@@ -34,37 +31,25 @@ class MockDirEntry:
         return self._is_symlink
 
 
+# In os.stat_result field order
+_STAT_DEFAULTS = dict(
+    st_mode=0o100644,
+    st_ino=1,
+    st_dev=1,
+    st_nlink=1,
+    st_uid=1000,
+    st_gid=1000,
+    st_size=0,
+    st_atime=1_600_000_000.0,
+    st_mtime=1_600_000_001.0,
+    st_ctime=1_600_000_002.0,
+)
+
+
 def make_fake_stat(**overrides):
-    """Create a minimal ``os.stat_result``‑like named‑tuple."""
-    stat = NamedTuple(
-        "StatResult",
-        [
-            ("st_mode", int),
-            ("st_ino", int),
-            ("st_dev", int),
-            ("st_nlink", int),
-            ("st_uid", int),
-            ("st_gid", int),
-            ("st_size", int),
-            ("st_atime", float),
-            ("st_mtime", float),
-            ("st_ctime", float),
-        ],
-    )
-    defaults = dict(
-        st_mode=0o100644,
-        st_ino=1,
-        st_dev=1,
-        st_nlink=1,
-        st_uid=1000,
-        st_gid=1000,
-        st_size=0,
-        st_atime=1_600_000_000.0,
-        st_mtime=1_600_000_001.0,
-        st_ctime=1_600_000_002.0,
-    )
-    defaults.update(overrides)
-    return stat(**defaults)
+    """Create an ``os.stat_result`` from defaults and field overrides."""
+    values = {**_STAT_DEFAULTS, **overrides}
+    return os.stat_result(tuple(values[field] for field in _STAT_DEFAULTS))
 
 
 def deterministic_random(seed: int = 0) -> Callable[[], float]:
@@ -91,8 +76,8 @@ class TestFileListingDataclasses(unittest.TestCase):
         self.assertEqual(stat_result.st_ino, file_entry.stat.st_ino)
         self.assertEqual(stat_result.st_dev, file_entry.stat.st_dev)
 
+    @unittest.skip("Deprecated test - refactor needed")
     def test_image_row_from_file_entry(self):
-        self.skipTest("Deprecated test - refactor needed")
         stat_result = make_fake_stat()
         path = "generic/fake/path/string/to/file.fake"
         dir_entry_like = MockDirEntry(
@@ -112,8 +97,8 @@ class TestFileListingDataclasses(unittest.TestCase):
         self.assertEqual(file_entry.stat.st_mtime, image_row.mtime)
         self.assertEqual(exp_randid, image_row.randid)
 
+    @unittest.skip("Deprecated test - refactor needed")
     def test_return_type_and_fields(self):
-        self.skipTest("Deprecated test - refactor needed")
         fake_stat = make_fake_stat(st_mtime=1234567890.0)
 
         def fake_stat_fn(*args):
@@ -155,8 +140,8 @@ class TestFileListingDataclasses(unittest.TestCase):
             cases.append(("C:\\Windows\\Path\\file.bmp", ""))
         return cases
 
+    @unittest.skip("Deprecated test - refactor needed")
     def test_path_derivation(self):
-        self.skipTest("Deprecated test - refactor needed")
         fake_stat = make_fake_stat()
 
         def fake_stat_fn(*args):
@@ -173,8 +158,8 @@ class TestFileListingDataclasses(unittest.TestCase):
     # ------------------------------------------------------------------
     # 3️⃣  Stat handling – verify that ``mtime`` comes from the stat result
     # ------------------------------------------------------------------
+    @unittest.skip("Deprecated test - refactor needed")
     def test_mtime_propagated(self):
-        self.skipTest("Deprecated test - refactor needed")
         fake_stat = make_fake_stat(st_mtime=1_234_567_890.0)
 
         def fake_stat_fn(*args):
@@ -187,8 +172,8 @@ class TestFileListingDataclasses(unittest.TestCase):
     # ------------------------------------------------------------------
     # 4️⃣  Default behaviour – when ``stat_fn`` is omitted
     # ------------------------------------------------------------------
+    @unittest.skip("Deprecated test - refactor needed")
     def test_default_uses_os_stat(self):
-        self.skipTest("Deprecated test - refactor needed")
         """If no ``stat_fn`` is supplied the function must call ``os.stat``."""
         with tempfile.NamedTemporaryFile(suffix=".png") as tmp:
             tmp.write(b"hello world")
@@ -209,8 +194,8 @@ class TestFileListingDataclasses(unittest.TestCase):
     # ------------------------------------------------------------------
     # 5️⃣  Random‑id edge cases – type and range
     # ------------------------------------------------------------------
+    @unittest.skip("Deprecated test - refactor needed")
     def test_randid_is_float_between_0_and_1(self):
-        self.skipTest("Deprecated test - refactor needed")
         fake_stat = make_fake_stat()
 
         def fake_stat_fn(*args):
@@ -225,15 +210,14 @@ class TestFileListingDataclasses(unittest.TestCase):
     # ------------------------------------------------------------------
     # 6️⃣  Error handling – invalid ``stat_fn`` or missing ``st_mtime``
     # ------------------------------------------------------------------
+    @unittest.skip("Deprecated test - refactor needed")
     def test_invalid_stat_fn_raises(self):
-        self.skipTest("Deprecated test - refactor needed")
         with self.assertRaises(TypeError):
             # noinspection PyTypeChecker
             build_row_from(file_path="a.jpg", stat_fn="not a function")
 
+    @unittest.skip("Deprecated test - refactor needed")
     def test_missing_mtime_attribute(self):
-        self.skipTest("Deprecated test - refactor needed")
-
         class IncompleteStat:
             pass
 
@@ -245,8 +229,8 @@ class TestFileListingDataclasses(unittest.TestCase):
     # ------------------------------------------------------------------
     # 7️⃣  No side‑effects – ensure the function does not touch the filesystem
     # ------------------------------------------------------------------
+    @unittest.skip("Deprecated test - refactor needed")
     def test_no_file_io_when_custom_stat_fn_used(self):
-        self.skipTest("Deprecated test - refactor needed")
         fake_stat = make_fake_stat(st_mtime=99.0)
         fake_stat_fn = mock.Mock(return_value=fake_stat)
 
@@ -260,8 +244,8 @@ class TestFileListingDataclasses(unittest.TestCase):
     # ------------------------------------------------------------------
     # 8️⃣  Type‑checking sanity – ensure mypy sees the correct signatures
     # ------------------------------------------------------------------
+    @unittest.skip("Deprecated test - refactor needed")
     def test_type_hints_exist(self):
-        self.skipTest("Deprecated test - refactor needed")
         from inspect import signature
 
         sig = signature(build_row_from)
@@ -12,9 +12,11 @@ class SignalQueue:
         }
 
     def poll_queue(self):
-        try:
-            signal_name = self.queue.get_nowait()
+        # Drain everything queued since the last poll in one pass
+        while True:
+            try:
+                signal_name = self.queue.get_nowait()
+            except queue.Empty:
+                return
             kwargs = {}
-            self.signals[signal_name].send("SignalQueue",**kwargs)
-        except queue.Empty:
-            return
\ No newline at end of file
+            self.signals[signal_name].send("SignalQueue",**kwargs)
\ No newline at end of file